@@ -6,7 +6,7 @@ from typing import TYPE_CHECKING, Dict, List, Optional
 
 import numpy as np
 from sklearn.metrics import average_precision_score
-from sklearn.metrics.pairwise import paired_cosine_distances, paired_euclidean_distances, paired_manhattan_distances
+from sklearn.metrics.pairwise import paired_cosine_distances
 
 from sentence_transformers.evaluation.SentenceEvaluator import SentenceEvaluator
 from sentence_transformers.readers import InputExample
@@ -238,13 +238,17 @@ class BinaryClassificationEvaluator(SentenceEvaluator):
                 embeddings1 = [emb_dict[sent] for sent in self.sentences1]
                 embeddings2 = [emb_dict[sent] for sent in self.sentences2]
 
-        cosine_scores = 1 - paired_cosine_distances(embeddings1, embeddings2)
-        manhattan_distances = paired_manhattan_distances(embeddings1, embeddings2)
-        euclidean_distances = paired_euclidean_distances(embeddings1, embeddings2)
-
         embeddings1_np = np.asarray(embeddings1)
         embeddings2_np = np.asarray(embeddings2)
-        dot_scores = np.sum(embeddings1_np * embeddings2_np, axis=-1)
+
+        cosine_scores = 1 - paired_cosine_distances(embeddings1_np, embeddings2_np)
+        # Accumulate in at least float32: sums of float16 embeddings, e.g. from a half precision model, overflow
+        # or get rounded, which introduces ties in the threshold search below
+        dtype = np.promote_types(np.result_type(embeddings1_np, embeddings2_np), np.float32)
+        abs_differences = np.abs(embeddings1_np - embeddings2_np)
+        manhattan_distances = abs_differences.sum(axis=-1, dtype=dtype)
+        euclidean_distances = np.sqrt(np.einsum("ij,ij->i", abs_differences, abs_differences, dtype=dtype))
+        dot_scores = np.einsum("ij,ij->i", embeddings1_np, embeddings2_np, dtype=dtype)
 
         labels = np.asarray(self.labels)
         output_scores = {}
@@ -2,21 +2,104 @@ import csv
 import logging
 import os
 from contextlib import nullcontext
-from typing import TYPE_CHECKING, Dict, List, Literal, Optional, Union
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Tuple, Union
 
 import numpy as np
+import torch
 from scipy.stats import pearsonr, spearmanr
-from sklearn.metrics.pairwise import paired_cosine_distances, paired_euclidean_distances, paired_manhattan_distances
+from torch import Tensor
 
 from sentence_transformers.evaluation.SentenceEvaluator import SentenceEvaluator
 from sentence_transformers.readers import InputExample
 from sentence_transformers.similarity_functions import SimilarityFunction
+from sentence_transformers.util import (
+    is_numba_available,
+    is_simsimd_available,
+    pairwise_cos_sim,
+    pairwise_dot_score,
+    pairwise_euclidean_sim,
+    pairwise_manhattan_sim,
+)
 
 if TYPE_CHECKING:
     from sentence_transformers.SentenceTransformer import SentenceTransformer
 
 logger = logging.getLogger(__name__)
 
+# Number of set bits in each possible byte, used to compute popcounts of packed binary embeddings without unpacking
+_POPCOUNT_LUT = np.array([bin(byte).count("1") for byte in range(256)], dtype=np.uint8)
+
+
+def _as_contiguous(embeddings: np.ndarray, dtype: np.dtype) -> np.ndarray:
+    """
+    Returns the embeddings as a C-contiguous array of the given dtype, such that the distance kernels can use their
+    fast code paths, and logs when embeddings that already have this dtype must be copied due to their memory layout.
+    Conversions from other dtypes, e.g. int8 to float32, always require a copy, so they are not logged.
+    """
+    contiguous_embeddings = np.ascontiguousarray(embeddings, dtype=dtype)
+    if contiguous_embeddings is not embeddings and embeddings.dtype == dtype:
+        logger.debug(
+            f"Copied {embeddings.dtype} embeddings with strides {embeddings.strides} into a C-contiguous {np.dtype(dtype)} array."
+        )
+    return contiguous_embeddings
+
+
+def _check_paired_shapes(embeddings1: Union[np.ndarray, Tensor], embeddings2: Union[np.ndarray, Tensor]) -> None:
+    """
+    Raises a ValueError unless the embeddings are two matrices of the same shape. The kernels read both matrices
+    with the indices of the first one without bounds checks, so a mismatch would otherwise read out of bounds.
+    """
+    if embeddings1.ndim != 2 or embeddings1.shape != embeddings2.shape:
+        raise ValueError(
+            "Expected two 2D embedding matrices with the same shape, "
+            f"but got shapes {tuple(embeddings1.shape)} and {tuple(embeddings2.shape)}."
+        )
+
+
+@lru_cache(maxsize=8)
+def _get_numba_similarities_kernel(dim: int):
+    """
+    Compiles (lazily, as importing numba is slow) a kernel that computes the paired cosine similarity, Manhattan
+    distance, Euclidean distance and dot product of each pair of rows in a single pass, in parallel over the rows.
+
+    The kernel is specialized for one embedding dimension: numba freezes ``dim`` as a compile-time constant, which
+    allows it to fully unroll and vectorize the inner loop. The embedding dimension rarely changes between
+    evaluations, so only a few kernels are kept.
+    """
+    import numba
+
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def kernel(embeddings1, embeddings2):
+        num_pairs = embeddings1.shape[0]
+        cosine_scores = np.empty(num_pairs, dtype=np.float32)
+        manhattan_distances = np.empty(num_pairs, dtype=np.float32)
+        euclidean_distances = np.empty(num_pairs, dtype=np.float32)
+        dot_products = np.empty(num_pairs, dtype=np.float32)
+        for i in numba.prange(num_pairs):
+            dot = 0.0
+            squared_norm1 = 0.0
+            squared_norm2 = 0.0
+            manhattan = 0.0
+            squared_euclidean = 0.0
+            for j in range(dim):
+                a = embeddings1[i, j]
+                b = embeddings2[i, j]
+                dot += a * b
+                squared_norm1 += a * a
+                squared_norm2 += b * b
+                difference = abs(a - b)
+                manhattan += difference
+                squared_euclidean += difference * difference
+            norm_product = np.sqrt(squared_norm1 * squared_norm2)
+            cosine_scores[i] = dot / norm_product if norm_product > 0 else 0.0
+            manhattan_distances[i] = -manhattan
+            euclidean_distances[i] = -np.sqrt(squared_euclidean)
+            dot_products[i] = dot
+        return cosine_scores, manhattan_distances, euclidean_distances, dot_products
+
+    return kernel
+
 
 class EmbeddingSimilarityEvaluator(SentenceEvaluator):
     """
@@ -69,6 +152,9 @@ class EmbeddingSimilarityEvaluator(SentenceEvaluator):
         write_csv: bool = True,
         precision: Optional[Literal["float32", "int8", "uint8", "binary", "ubinary"]] = None,
         truncate_dim: Optional[int] = None,
+        precomputed_embeddings1: Optional[np.ndarray] = None,
+        precomputed_embeddings2: Optional[np.ndarray] = None,
+        deduplicate: bool = True,
     ):
         """
         Constructs an evaluator based for the dataset.
@@ -84,20 +170,44 @@ class EmbeddingSimilarityEvaluator(SentenceEvaluator):
             show_progress_bar (bool, optional): Whether to show a progress bar during evaluation. Defaults to False.
             write_csv (bool, optional): Whether to write the evaluation results to a CSV file. Defaults to True.
             precision (Optional[Literal["float32", "int8", "uint8", "binary", "ubinary"]], optional): The precision
-                to use for the embeddings. Can be "float32", "int8", "uint8", "binary", or "ubinary". Defaults to None.
+                to use for the embeddings. Can be "float32", "int8", "uint8", "binary", or "ubinary". For "int8" and
+                "uint8", both sentence lists are encoded together, so a single set of quantization ranges is
+                calibrated on sentences1 and sentences2 combined. Defaults to None.
             truncate_dim (Optional[int], optional): The dimension to truncate sentence embeddings to. `None` uses the
                 model's current truncation dimension. Defaults to None.
+            precomputed_embeddings1 (Optional[np.ndarray], optional): Fixed embeddings for sentences1, e.g. from a
+                frozen teacher model. If provided, sentences1 are not encoded on every evaluation. The embeddings must
+                have been computed with the same ``precision`` and ``truncate_dim`` as the evaluator (and with
+                ``normalize_embeddings=True`` if ``precision`` is set). With "int8" or "uint8" precision, the
+                encoded side is calibrated only on its own embeddings, so to keep both sides on the same scale,
+                precompute both sides with shared ``ranges``. Defaults to None.
+            precomputed_embeddings2 (Optional[np.ndarray], optional): Fixed embeddings for sentences2, analogous to
+                ``precomputed_embeddings1``. Defaults to None.
+            deduplicate (bool, optional): Whether to embed each unique sentence only once, even if it occurs multiple
+                times across sentences1 and sentences2. Defaults to True.
         """
         super().__init__()
         self.sentences1 = sentences1
         self.sentences2 = sentences2
-        self.scores = scores
+        self.scores = np.asarray(scores, dtype=np.float32)
         self.write_csv = write_csv
         self.precision = precision
         self.truncate_dim = truncate_dim
+        self.precomputed_embeddings1 = precomputed_embeddings1
+        self.precomputed_embeddings2 = precomputed_embeddings2
+        self.deduplicate = deduplicate
 
         assert len(self.sentences1) == len(self.sentences2)
-        assert len(self.sentences1) == len(self.scores)
+        assert self.scores.shape == (len(self.sentences1),)
+        for precomputed_embeddings in (precomputed_embeddings1, precomputed_embeddings2):
+            if precomputed_embeddings is not None:
+                assert precomputed_embeddings.ndim == 2 and len(precomputed_embeddings) == len(self.sentences1)
+                if truncate_dim is not None:
+                    # Packed binary embeddings hold 8 dimensions per byte
+                    packed = precision in ("binary", "ubinary")
+                    assert precomputed_embeddings.shape[1] == ((truncate_dim + 7) // 8 if packed else truncate_dim)
+        if precomputed_embeddings1 is not None and precomputed_embeddings2 is not None:
+            assert precomputed_embeddings1.shape == precomputed_embeddings2.shape
 
         self.main_similarity = SimilarityFunction(main_similarity) if main_similarity else None
         self.name = name
@@ -127,6 +237,10 @@ class EmbeddingSimilarityEvaluator(SentenceEvaluator):
             "dot_pearson",
             "dot_spearman",
         ]
+        # The results CSV is opened once and kept open, so that frequent evaluations only append a buffered row
+        self._csv_path = None
+        self._csv_file_handle = None
+        self._csv_writer = None
 
     @classmethod
     def from_input_examples(cls, examples: List[InputExample], **kwargs):
@@ -155,89 +269,55 @@ class EmbeddingSimilarityEvaluator(SentenceEvaluator):
 
         logger.info(f"EmbeddingSimilarityEvaluator: Evaluating the model on the {self.name} dataset{out_txt}:")
 
-        with nullcontext() if self.truncate_dim is None else model.truncate_sentence_embeddings(self.truncate_dim):
-            embeddings1 = model.encode(
-                self.sentences1,
-                batch_size=self.batch_size,
-                show_progress_bar=self.show_progress_bar,
-                convert_to_numpy=True,
-                precision=self.precision,
-                normalize_embeddings=bool(self.precision),
-            )
-            embeddings2 = model.encode(
-                self.sentences2,
-                batch_size=self.batch_size,
-                show_progress_bar=self.show_progress_bar,
-                convert_to_numpy=True,
-                precision=self.precision,
-                normalize_embeddings=bool(self.precision),
-            )
-        # Binary and ubinary embeddings are packed, so we need to unpack them for the distance metrics
-        if self.precision == "binary":
-            embeddings1 = (embeddings1 + 128).astype(np.uint8)
-            embeddings2 = (embeddings2 + 128).astype(np.uint8)
-        if self.precision in ("ubinary", "binary"):
-            embeddings1 = np.unpackbits(embeddings1, axis=1)
-            embeddings2 = np.unpackbits(embeddings2, axis=1)
-
-        labels = self.scores
-
-        cosine_scores = 1 - (paired_cosine_distances(embeddings1, embeddings2))
-        manhattan_distances = -paired_manhattan_distances(embeddings1, embeddings2)
-        euclidean_distances = -paired_euclidean_distances(embeddings1, embeddings2)
-        dot_products = [np.dot(emb1, emb2) for emb1, emb2 in zip(embeddings1, embeddings2)]
-
-        eval_pearson_cosine, _ = pearsonr(labels, cosine_scores)
-        eval_spearman_cosine, _ = spearmanr(labels, cosine_scores)
-
-        eval_pearson_manhattan, _ = pearsonr(labels, manhattan_distances)
-        eval_spearman_manhattan, _ = spearmanr(labels, manhattan_distances)
-
-        eval_pearson_euclidean, _ = pearsonr(labels, euclidean_distances)
-        eval_spearman_euclidean, _ = spearmanr(labels, euclidean_distances)
-
-        eval_pearson_dot, _ = pearsonr(labels, dot_products)
-        eval_spearman_dot, _ = spearmanr(labels, dot_products)
+        metrics = self.compute_metrices(model)
 
         logger.info(
-            "Cosine-Similarity :\tPearson: {:.4f}\tSpearman: {:.4f}".format(eval_pearson_cosine, eval_spearman_cosine)
+            "Cosine-Similarity :\tPearson: {:.4f}\tSpearman: {:.4f}".format(
+                metrics["pearson_cosine"], metrics["spearman_cosine"]
+            )
         )
         logger.info(
             "Manhattan-Distance:\tPearson: {:.4f}\tSpearman: {:.4f}".format(
-                eval_pearson_manhattan, eval_spearman_manhattan
+                metrics["pearson_manhattan"], metrics["spearman_manhattan"]
             )
         )
         logger.info(
             "Euclidean-Distance:\tPearson: {:.4f}\tSpearman: {:.4f}".format(
-                eval_pearson_euclidean, eval_spearman_euclidean
+                metrics["pearson_euclidean"], metrics["spearman_euclidean"]
             )
         )
         logger.info(
-            "Dot-Product-Similarity:\tPearson: {:.4f}\tSpearman: {:.4f}".format(eval_pearson_dot, eval_spearman_dot)
+            "Dot-Product-Similarity:\tPearson: {:.4f}\tSpearman: {:.4f}".format(
+                metrics["pearson_dot"], metrics["spearman_dot"]
+            )
         )
 
         if output_path is not None and self.write_csv:
             csv_path = os.path.join(output_path, self.csv_file)
-            output_file_exists = os.path.isfile(csv_path)
-            with open(csv_path, newline="", mode="a" if output_file_exists else "w", encoding="utf-8") as f:
-                writer = csv.writer(f)
+            if not self._is_csv_file_open(csv_path):
+                self.close()
+                output_file_exists = os.path.isfile(csv_path)
+                self._csv_file_handle = open(csv_path, newline="", mode="a", encoding="utf-8", buffering=1 << 16)
+                self._csv_writer = csv.writer(self._csv_file_handle)
+                self._csv_path = csv_path
                 if not output_file_exists:
-                    writer.writerow(self.csv_headers)
-
-                writer.writerow(
-                    [
-                        epoch,
-                        steps,
-                        eval_pearson_cosine,
-                        eval_spearman_cosine,
-                        eval_pearson_euclidean,
-                        eval_spearman_euclidean,
-                        eval_pearson_manhattan,
-                        eval_spearman_manhattan,
-                        eval_pearson_dot,
-                        eval_spearman_dot,
-                    ]
-                )
+                    self._csv_writer.writerow(self.csv_headers)
+
+            self._csv_writer.writerow(
+                [
+                    epoch,
+                    steps,
+                    metrics["pearson_cosine"],
+                    metrics["spearman_cosine"],
+                    metrics["pearson_euclidean"],
+                    metrics["spearman_euclidean"],
+                    metrics["pearson_manhattan"],
+                    metrics["spearman_manhattan"],
+                    metrics["pearson_dot"],
+                    metrics["spearman_dot"],
+                ]
+            )
+            self._csv_file_handle.flush()
 
         self.primary_metric = {
             SimilarityFunction.COSINE: "spearman_cosine",
@@ -245,24 +325,260 @@ class EmbeddingSimilarityEvaluator(SentenceEvaluator):
             SimilarityFunction.MANHATTAN: "spearman_manhattan",
             SimilarityFunction.DOT_PRODUCT: "spearman_dot",
         }.get(self.main_similarity, "spearman_max")
-        metrics = {
-            "pearson_cosine": eval_pearson_cosine,
-            "spearman_cosine": eval_spearman_cosine,
-            "pearson_manhattan": eval_pearson_manhattan,
-            "spearman_manhattan": eval_spearman_manhattan,
-            "pearson_euclidean": eval_pearson_euclidean,
-            "spearman_euclidean": eval_spearman_euclidean,
-            "pearson_dot": eval_pearson_dot,
-            "spearman_dot": eval_spearman_dot,
-            "pearson_max": max(eval_pearson_cosine, eval_pearson_manhattan, eval_pearson_euclidean, eval_pearson_dot),
-            "spearman_max": max(
-                eval_spearman_cosine, eval_spearman_manhattan, eval_spearman_euclidean, eval_spearman_dot
-            ),
-        }
         metrics = self.prefix_name_to_metrics(metrics, self.name)
         self.store_metrics_in_model_card_data(model, metrics)
         return metrics
 
+    def compute_metrices(self, model: "SentenceTransformer") -> Dict[str, float]:
+        """
+        Computes the Pearson and Spearman correlations of all similarity functions with the gold scores, regardless
+        of ``main_similarity``, such that a single evaluation provides the scores for every similarity function.
+
+        Args:
+            model (SentenceTransformer): The model to evaluate.
+
+        Returns:
+            Dict[str, float]: The correlations, with keys such as "pearson_cosine" and "spearman_max", without the
+            evaluator name as prefix.
+        """
+        # For models on a GPU, the float embeddings stay on the device and only the scores are moved to the CPU
+        use_tensors = model.device.type == "cuda" and self.precision in (None, "float32")
+
+        # Encode both sides in a single call so that batches are fully packed across the two lists,
+        # skipping any side for which the embeddings were precomputed
+        sentences = []
+        if self.precomputed_embeddings1 is None:
+            sentences += list(self.sentences1)
+        if self.precomputed_embeddings2 is None:
+            sentences += list(self.sentences2)
+        if sentences:
+            inverse_indices = None
+            if self.deduplicate:
+                try:
+                    # If the sentences are hashable, then we can embed each unique sentence only once and gather the
+                    # embeddings back to their original positions
+                    sentence_to_index = {}
+                    inverse_indices = np.array(
+                        [sentence_to_index.setdefault(sentence, len(sentence_to_index)) for sentence in sentences]
+                    )
+                    sentences = list(sentence_to_index)
+                except TypeError:
+                    # Otherwise we just embed everything, e.g. if the sentences are images for evaluating a CLIP model
+                    pass
+
+            with nullcontext() if self.truncate_dim is None else model.truncate_sentence_embeddings(self.truncate_dim):
+                embeddings = model.encode(
+                    sentences,
+                    batch_size=self.batch_size,
+                    show_progress_bar=self.show_progress_bar,
+                    convert_to_numpy=True,
+                    convert_to_tensor=use_tensors,
+                    precision=self.precision,
+                    normalize_embeddings=bool(self.precision),
+                )
+            if inverse_indices is not None:
+                if use_tensors:
+                    inverse_indices = torch.from_numpy(inverse_indices).to(embeddings.device)
+                embeddings = embeddings[inverse_indices]
+
+        if self.precomputed_embeddings1 is None:
+            embeddings1 = embeddings[: len(self.sentences1)]
+            embeddings = embeddings[len(self.sentences1) :]
+        else:
+            embeddings1 = self.precomputed_embeddings1
+        embeddings2 = embeddings if self.precomputed_embeddings2 is None else self.precomputed_embeddings2
+
+        labels = self.scores
+        # Whether precomputed embeddings match the encoded ones, e.g. in their truncate_dim, is checked by the kernels
+        assert len(embeddings1) == len(labels)
+
+        if use_tensors:
+            cosine_scores, manhattan_distances, euclidean_distances, dot_products = self.tensor_similarities(
+                torch.as_tensor(embeddings1, device=model.device), torch.as_tensor(embeddings2, device=model.device)
+            )
+        elif self.precision in ("ubinary", "binary"):
+            cosine_scores, manhattan_distances, euclidean_distances, dot_products = self.binary_similarities(
+                embeddings1, embeddings2, signed=self.precision == "binary"
+            )
+        else:
+            cosine_scores, manhattan_distances, euclidean_distances, dot_products = self.float_similarities(
+                embeddings1, embeddings2
+            )
+
+        # The per-pair scores are float32, but the correlations are computed in float64 to preserve their accuracy
+        labels = labels.astype(np.float64)
+        metrics = {}
+        for short_name, scores in [
+            ("cosine", cosine_scores),
+            ("manhattan", manhattan_distances),
+            ("euclidean", euclidean_distances),
+            ("dot", dot_products),
+        ]:
+            scores = scores.astype(np.float64)
+            metrics[f"pearson_{short_name}"] = float(pearsonr(labels, scores)[0])
+            metrics[f"spearman_{short_name}"] = float(spearmanr(labels, scores)[0])
+        metrics["pearson_max"] = max(value for key, value in metrics.items() if key.startswith("pearson_"))
+        metrics["spearman_max"] = max(value for key, value in metrics.items() if key.startswith("spearman_"))
+        return metrics
+
+    def _is_csv_file_open(self, csv_path: str) -> bool:
+        """
+        Returns whether the open results CSV handle still refers to the file at ``csv_path``. The file or its
+        directory may have been deleted or replaced since the handle was opened, in which case rows written to the
+        handle would be lost.
+        """
+        if self._csv_file_handle is None or csv_path != self._csv_path:
+            return False
+        try:
+            path_stat = os.stat(csv_path)
+        except FileNotFoundError:
+            return False
+        return os.path.samestat(os.fstat(self._csv_file_handle.fileno()), path_stat)
+
+    def close(self) -> None:
+        """
+        Closes the results CSV file if it is open. It is reopened on the next evaluation that writes to it.
+        """
+        if self._csv_file_handle is not None:
+            self._csv_file_handle.close()
+        self._csv_path = None
+        self._csv_file_handle = None
+        self._csv_writer = None
+
+    def __del__(self) -> None:
+        # The attributes may be missing if __init__ did not complete
+        if getattr(self, "_csv_file_handle", None) is not None:
+            self.close()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Open file handles cannot be pickled or deep-copied, so the copy reopens the CSV when it first writes to it
+        state = self.__dict__.copy()
+        state["_csv_path"] = None
+        state["_csv_file_handle"] = None
+        state["_csv_writer"] = None
+        return state
+
+    @staticmethod
+    def tensor_similarities(
+        embeddings1: Tensor, embeddings2: Tensor
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Computes the paired cosine similarity, negative Manhattan distance, negative Euclidean distance and dot product
+        of embedding tensors on their own device, e.g. a GPU. Only the resulting scores, rather than the embeddings
+        themselves, are moved to the CPU.
+
+        Args:
+            embeddings1 (Tensor): Embeddings of the first sentence in each pair.
+            embeddings2 (Tensor): Embeddings of the second sentence in each pair, with the same shape and device as
+                ``embeddings1``.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]: The cosine similarities, negative Manhattan
+            distances, negative Euclidean distances and dot products of each pair.
+        """
+        _check_paired_shapes(embeddings1, embeddings2)
+        # Upcast e.g. float16 embeddings before the reductions, as the squared distances quickly overflow float16
+        embeddings1 = embeddings1.float()
+        embeddings2 = embeddings2.float()
+        similarities = (
+            pairwise_cos_sim(embeddings1, embeddings2),
+            pairwise_manhattan_sim(embeddings1, embeddings2),
+            pairwise_euclidean_sim(embeddings1, embeddings2),
+            pairwise_dot_score(embeddings1, embeddings2),
+        )
+        return tuple(similarity.cpu().numpy() for similarity in similarities)
+
+    @staticmethod
+    def float_similarities(
+        embeddings1: np.ndarray, embeddings2: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Computes the paired cosine similarity, negative Manhattan distance, negative Euclidean distance and dot product
+        of float (or int8/uint8) embeddings. The dot products and squared norms are each computed once and shared by
+        the cosine similarity and the dot product, while the Manhattan and Euclidean distances share a single matrix
+        of absolute differences. If numba is installed, all metrics are instead computed in one fused pass. float16
+        embeddings are upcast to float32, as NumPy emulates half precision arithmetic in software.
+
+        Args:
+            embeddings1 (np.ndarray): Embeddings of the first sentence in each pair.
+            embeddings2 (np.ndarray): Embeddings of the second sentence in each pair, with the same shape as
+                ``embeddings1``.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]: The cosine similarities, negative Manhattan
+            distances, negative Euclidean distances and dot products of each pair.
+        """
+        _check_paired_shapes(embeddings1, embeddings2)
+        embeddings1 = _as_contiguous(embeddings1, np.float32)
+        embeddings2 = _as_contiguous(embeddings2, np.float32)
+
+        if is_numba_available():
+            return _get_numba_similarities_kernel(embeddings1.shape[1])(embeddings1, embeddings2)
+
+        dot_products = np.einsum("ij,ij->i", embeddings1, embeddings2)
+        squared_norms1 = np.einsum("ij,ij->i", embeddings1, embeddings1)
+        squared_norms2 = np.einsum("ij,ij->i", embeddings2, embeddings2)
+
+        norm_products = np.sqrt(squared_norms1 * squared_norms2)
+        cosine_scores = np.divide(
+            dot_products, norm_products, out=np.zeros_like(dot_products), where=norm_products > 0
+        )
+
+        abs_differences = np.abs(embeddings1 - embeddings2)
+        manhattan_distances = abs_differences.sum(axis=1)
+        euclidean_distances = np.sqrt(np.einsum("ij,ij->i", abs_differences, abs_differences))
+        return cosine_scores, -manhattan_distances, -euclidean_distances, dot_products
+
+    @staticmethod
+    def binary_similarities(
+        embeddings1: np.ndarray, embeddings2: np.ndarray, signed: bool = False
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Computes the paired cosine similarity, negative Manhattan distance, negative Euclidean distance and dot product
+        of packed binary embeddings, without unpacking them. For vectors of bits, the Manhattan distance is the
+        Hamming distance popcount(a ^ b), the squared Euclidean distance equals the Manhattan distance, and the dot
+        product is popcount(a & b) = (popcount(a) + popcount(b) - popcount(a ^ b)) / 2.
+
+        Args:
+            embeddings1 (np.ndarray): Packed binary embeddings, as returned by ``quantize_embeddings``.
+            embeddings2 (np.ndarray): Packed binary embeddings with the same shape as ``embeddings1``.
+            signed (bool, optional): Whether the embeddings use the signed "binary" precision rather than the
+                unsigned "ubinary" precision. Defaults to False.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]: The cosine similarities, negative Manhattan
+            distances, negative Euclidean distances and dot products of each pair.
+        """
+        _check_paired_shapes(embeddings1, embeddings2)
+        if signed:
+            # "binary" embeddings are "ubinary" embeddings shifted by -128
+            embeddings1 = (embeddings1.astype(np.int16) + 128).astype(np.uint8)
+            embeddings2 = (embeddings2.astype(np.int16) + 128).astype(np.uint8)
+        embeddings1 = _as_contiguous(embeddings1, np.uint8)
+        embeddings2 = _as_contiguous(embeddings2, np.uint8)
+
+        hamming = None
+        if is_simsimd_available():
+            import simsimd
+
+            try:
+                hamming = np.asarray(simsimd.hamming(embeddings1, embeddings2, "bin8"))
+                hamming = hamming.astype(np.float32, copy=False)
+            except (TypeError, ValueError):
+                # SimSIMD only supports Hamming distances of packed bits as of version 6
+                pass
+        if hamming is None:
+            hamming = _POPCOUNT_LUT[np.bitwise_xor(embeddings1, embeddings2)].sum(axis=1, dtype=np.float32)
+        norms1 = _POPCOUNT_LUT[embeddings1].sum(axis=1, dtype=np.float32)
+        norms2 = _POPCOUNT_LUT[embeddings2].sum(axis=1, dtype=np.float32)
+
+        dot_products = (norms1 + norms2 - hamming) / 2
+        norm_products = np.sqrt(norms1 * norms2)
+        cosine_scores = np.divide(
+            dot_products, norm_products, out=np.zeros_like(dot_products), where=norm_products > 0
+        )
+        return cosine_scores, -hamming, -np.sqrt(hamming), dot_products
+
     @property
     def description(self) -> str:
         return "Semantic Similarity"
@@ -4,6 +4,8 @@ import os
 from contextlib import nullcontext
 from typing import TYPE_CHECKING, Dict, List, Optional
 
+import numpy as np
+
 from sentence_transformers.evaluation.SentenceEvaluator import SentenceEvaluator
 
 if TYPE_CHECKING:
@@ -115,7 +117,11 @@ class MSEEvaluator(SentenceEvaluator):
                 convert_to_numpy=True,
             )
 
-        mse = ((self.source_embeddings - target_embeddings) ** 2).mean()
+        # Square the differences in place, so that only one full-size temporary is allocated. The differences keep
+        # the promoted dtype, e.g. float32 for a float16 student and a float32 teacher
+        squared_errors = np.subtract(self.source_embeddings, target_embeddings)
+        np.square(squared_errors, out=squared_errors)
+        mse = squared_errors.mean(dtype=np.float64)
         mse *= 100
 
         logger.info(f"MSE evaluation (lower = better) on the {self.name} dataset{out_txt}:")
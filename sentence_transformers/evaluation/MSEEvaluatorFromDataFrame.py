@@ -96,7 +96,9 @@ class MSEEvaluatorFromDataFrame(SentenceEvaluator):
             with nullcontext() if self.truncate_dim is None else model.truncate_sentence_embeddings(self.truncate_dim):
                 trg_embeddings = np.asarray(model.encode(trg_sentences, batch_size=self.batch_size))
 
-            mse = ((src_embeddings - trg_embeddings) ** 2).mean()
+            squared_errors = np.subtract(src_embeddings, trg_embeddings)
+            np.square(squared_errors, out=squared_errors)
+            mse = squared_errors.mean(dtype=np.float64)
             mse *= 100
             mse_scores.append(mse)
 
@@ -5,7 +5,7 @@ from contextlib import nullcontext
 from typing import TYPE_CHECKING, Dict, List, Optional, Union
 
 import numpy as np
-from sklearn.metrics.pairwise import paired_cosine_distances, paired_euclidean_distances, paired_manhattan_distances
+from sklearn.metrics.pairwise import paired_cosine_distances
 
 from sentence_transformers.evaluation.SentenceEvaluator import SentenceEvaluator
 from sentence_transformers.readers import InputExample
@@ -167,17 +167,26 @@ class TripletEvaluator(SentenceEvaluator):
         pos_cos_distance = paired_cosine_distances(embeddings_anchors, embeddings_positives)
         neg_cos_distances = paired_cosine_distances(embeddings_anchors, embeddings_negatives)
 
+        # Sum in at least float32, as the distances of float16 embeddings overflow in half precision
+        dtype = np.promote_types(
+            np.result_type(embeddings_anchors, embeddings_positives, embeddings_negatives), np.float32
+        )
+
         # Dot score
-        pos_dot_distance = np.sum(embeddings_anchors * embeddings_positives, axis=-1)
-        neg_dot_distances = np.sum(embeddings_anchors * embeddings_negatives, axis=-1)
+        pos_dot_distance = np.einsum("ij,ij->i", embeddings_anchors, embeddings_positives, dtype=dtype)
+        neg_dot_distances = np.einsum("ij,ij->i", embeddings_anchors, embeddings_negatives, dtype=dtype)
+
+        # Manhattan and Euclidean, both from the same absolute differences
+        pos_abs_differences = np.abs(embeddings_anchors - embeddings_positives)
+        neg_abs_differences = np.abs(embeddings_anchors - embeddings_negatives)
 
         # Manhattan
-        pos_manhattan_distance = paired_manhattan_distances(embeddings_anchors, embeddings_positives)
-        neg_manhattan_distances = paired_manhattan_distances(embeddings_anchors, embeddings_negatives)
+        pos_manhattan_distance = pos_abs_differences.sum(axis=-1, dtype=dtype)
+        neg_manhattan_distances = neg_abs_differences.sum(axis=-1, dtype=dtype)
 
         # Euclidean
-        pos_euclidean_distance = paired_euclidean_distances(embeddings_anchors, embeddings_positives)
-        neg_euclidean_distances = paired_euclidean_distances(embeddings_anchors, embeddings_negatives)
+        pos_euclidean_distance = np.sqrt(np.einsum("ij,ij->i", pos_abs_differences, pos_abs_differences, dtype=dtype))
+        neg_euclidean_distances = np.sqrt(np.einsum("ij,ij->i", neg_abs_differences, neg_abs_differences, dtype=dtype))
 
         for idx in range(len(pos_cos_distance)):
             num_triplets += 1
@@ -952,6 +952,36 @@ def is_datasets_available() -> bool:
     return importlib.util.find_spec("datasets") is not None
 
 
+@functools.lru_cache(maxsize=None)
+def is_numba_available() -> bool:
+    """
+    Returns True if the numba library is available and can be imported. numba only supports a limited range of
+    NumPy versions, so importing an installed numba can still fail.
+    """
+    if importlib.util.find_spec("numba") is None:
+        return False
+    try:
+        import numba  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+@functools.lru_cache(maxsize=None)
+def is_simsimd_available() -> bool:
+    """
+    Returns True if the simsimd library is available and can be imported. simsimd is built against a specific NumPy
+    ABI, so importing an installed simsimd can still fail.
+    """
+    if importlib.util.find_spec("simsimd") is None:
+        return False
+    try:
+        import simsimd  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
 def is_training_available() -> bool:
     """
     Returns True if we have the required dependencies for training Sentence Transformer models
@@ -2,12 +2,25 @@
 Tests the correct computation of evaluation scores from BinaryClassificationEvaluator
 """
 
+import copy
 import csv
 import gzip
+import importlib
 import os
+import pickle
+import shutil
+import sys
+import zlib
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+from unittest import mock
 
 import numpy as np
+import pytest
+import torch
+from scipy.stats import pearsonr, spearmanr
 from sklearn.metrics import accuracy_score, f1_score
+from sklearn.metrics.pairwise import paired_cosine_distances, paired_euclidean_distances, paired_manhattan_distances
 from torch.utils.data import DataLoader
 
 from sentence_transformers import (
@@ -17,6 +30,54 @@ from sentence_transformers import (
     losses,
     util,
 )
+from sentence_transformers.quantization import quantize_embeddings
+
+
+class RecordingModel:
+    """Deterministic stand-in for a SentenceTransformer that records the sentences passed to ``encode``"""
+
+    def __init__(self, dim: int = 16, scale: float = 1.0, dtype: np.dtype = np.float32) -> None:
+        self.dim = dim
+        self.scale = scale
+        self.dtype = dtype
+        self.device = torch.device("cpu")
+        self.model_card_data = mock.MagicMock()
+        self.encoded_sentences = []
+
+    def embed(self, sentences: List[str], normalize_embeddings: bool = False) -> np.ndarray:
+        embeddings = np.stack(
+            [
+                np.random.default_rng(zlib.crc32(str(sentence).encode())).normal(scale=self.scale, size=self.dim)
+                for sentence in sentences
+            ]
+        ).astype(self.dtype)
+        if normalize_embeddings:
+            embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True)
+        return embeddings
+
+    def encode(
+        self,
+        sentences: List[str],
+        precision: Optional[str] = None,
+        normalize_embeddings: bool = False,
+        convert_to_tensor: bool = False,
+        **kwargs,
+    ):
+        self.encoded_sentences.append(list(sentences))
+        embeddings = self.embed(sentences, normalize_embeddings=normalize_embeddings)
+        if precision not in (None, "float32"):
+            embeddings = quantize_embeddings(embeddings, precision=precision)
+        if convert_to_tensor:
+            return torch.from_numpy(embeddings)
+        return embeddings
+
+
+def get_similarity_dataset() -> Tuple[List[str], List[str], np.ndarray]:
+    """Returns sentence pairs in which sentences repeat both within and across the two lists"""
+    sentences1 = [f"sentence {idx % 15}" for idx in range(40)]
+    sentences2 = [f"sentence {idx % 20 + 10}" for idx in range(40)]
+    scores = np.random.default_rng(0).uniform(0, 1, 40)
+    return sentences1, sentences2, scores
 
 
 def test_BinaryClassificationEvaluator_find_best_f1_and_threshold() -> None:
@@ -51,6 +112,477 @@ def test_BinaryClassificationEvaluator_find_best_accuracy_and_threshold() -> Non
     assert np.abs(max_acc - sklearn_acc) < 1e-6
 
 
+# float16 embeddings with 768 dimensions and a scale of 20 overflow float16 when summing their squared differences
+PAIRED_DISTANCES_EMBEDDINGS = [(np.float32, 16, 1.0), (np.float16, 16, 1.0), (np.float16, 768, 20.0)]
+
+
+@pytest.mark.parametrize("dtype, dim, scale", PAIRED_DISTANCES_EMBEDDINGS)
+def test_BinaryClassificationEvaluator_paired_distances(dtype: np.dtype, dim: int, scale: float) -> None:
+    """Tests that the Manhattan and Euclidean distances match the sklearn paired distances, also for float16"""
+    sentences1, sentences2, _ = get_similarity_dataset()
+    labels = np.random.default_rng(0).integers(0, 2, len(sentences1))
+    model = RecordingModel(dim=dim, scale=scale, dtype=dtype)
+    evaluator = evaluation.BinaryClassificationEvaluator(sentences1, sentences2, labels.tolist())
+    scores = evaluator.compute_metrices(model)
+
+    embeddings1 = model.embed(sentences1)
+    embeddings2 = model.embed(sentences2)
+    for short_name, distances in [
+        ("manhattan", paired_manhattan_distances(embeddings1, embeddings2)),
+        ("euclidean", paired_euclidean_distances(embeddings1, embeddings2)),
+    ]:
+        accuracy, accuracy_threshold = evaluation.BinaryClassificationEvaluator.find_best_acc_and_threshold(
+            distances, labels, high_score_more_similar=False
+        )
+        assert np.isfinite(scores[short_name]["accuracy_threshold"])
+        assert scores[short_name]["accuracy"] == pytest.approx(accuracy)
+        assert scores[short_name]["accuracy_threshold"] == pytest.approx(accuracy_threshold, rel=1e-3)
+
+
+@pytest.mark.parametrize("dtype, dim, scale", PAIRED_DISTANCES_EMBEDDINGS)
+def test_TripletEvaluator_paired_distances(dtype: np.dtype, dim: int, scale: float) -> None:
+    """Tests that the Manhattan and Euclidean accuracies match the sklearn paired distances, also for float16"""
+    anchors, positives, _ = get_similarity_dataset()
+    negatives = [f"sentence {idx % 25 + 5}" for idx in range(len(anchors))]
+    model = RecordingModel(dim=dim, scale=scale, dtype=dtype)
+    metrics = evaluation.TripletEvaluator(anchors, positives, negatives)(model)
+
+    embeddings_anchors = model.embed(anchors)
+    embeddings_positives = model.embed(positives)
+    embeddings_negatives = model.embed(negatives)
+    for short_name, paired_distances in [
+        ("manhattan", paired_manhattan_distances),
+        ("euclidean", paired_euclidean_distances),
+    ]:
+        accuracy = np.mean(
+            paired_distances(embeddings_anchors, embeddings_positives)
+            < paired_distances(embeddings_anchors, embeddings_negatives)
+        )
+        assert metrics[f"{short_name}_accuracy"] == pytest.approx(accuracy)
+
+
+# Squared differences of embeddings with a scale of 200 overflow float16
+MSE_DTYPES = [(np.float32, np.float16), (np.float16, np.float32)]
+
+
+@pytest.mark.parametrize("teacher_dtype, student_dtype", MSE_DTYPES)
+def test_MSEEvaluator_mixed_precision(teacher_dtype: np.dtype, student_dtype: np.dtype) -> None:
+    """Tests that the MSE of float16 and float32 embeddings is computed in float32 rather than in half precision"""
+    source_sentences, target_sentences, _ = get_similarity_dataset()
+    teacher_model = RecordingModel(dim=64, scale=200, dtype=teacher_dtype)
+    student_model = RecordingModel(dim=64, scale=200, dtype=student_dtype)
+    evaluator = evaluation.MSEEvaluator(source_sentences, target_sentences, teacher_model=teacher_model)
+    metrics = evaluator(student_model)
+
+    source_embeddings = teacher_model.embed(source_sentences).astype(np.float32)
+    target_embeddings = student_model.embed(target_sentences).astype(np.float32)
+    expected_mse = ((source_embeddings - target_embeddings) ** 2).mean() * 100
+    assert np.isfinite(metrics["negative_mse"])
+    assert metrics["negative_mse"] == pytest.approx(-expected_mse, rel=1e-5)
+
+
+@pytest.mark.parametrize("teacher_dtype, student_dtype", MSE_DTYPES)
+def test_MSEEvaluatorFromDataFrame_mixed_precision(teacher_dtype: np.dtype, student_dtype: np.dtype) -> None:
+    """Tests that the MSE of float16 and float32 embeddings is computed in float32 rather than in half precision"""
+    source_sentences, target_sentences, _ = get_similarity_dataset()
+    dataframe = [{"en": source, "de": target} for source, target in zip(source_sentences, target_sentences)]
+    teacher_model = RecordingModel(dim=64, scale=200, dtype=teacher_dtype)
+    student_model = RecordingModel(dim=64, scale=200, dtype=student_dtype)
+    student_model.eval = mock.Mock()
+    evaluator = evaluation.MSEEvaluatorFromDataFrame(dataframe, teacher_model, combinations=[("en", "de")])
+    metrics = evaluator(student_model)
+
+    source_embeddings = teacher_model.embed(source_sentences).astype(np.float32)
+    target_embeddings = student_model.embed(target_sentences).astype(np.float32)
+    expected_mse = ((source_embeddings - target_embeddings) ** 2).mean() * 100
+    assert np.isfinite(metrics["negative_mse"])
+    assert metrics["negative_mse"] == pytest.approx(-expected_mse, rel=1e-5)
+
+
+NUMBA_BACKEND = pytest.param(
+    "numba", marks=pytest.mark.skipif(not util.is_numba_available(), reason="numba is not installed")
+)
+SIMSIMD_BACKEND = pytest.param(
+    "simsimd", marks=pytest.mark.skipif(not util.is_simsimd_available(), reason="SimSIMD is not installed")
+)
+SIMILARITY_BACKENDS = [NUMBA_BACKEND, SIMSIMD_BACKEND, "numpy"]
+
+
+@pytest.fixture()
+def similarity_backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    """Restricts the EmbeddingSimilarityEvaluator similarity kernels to a single backend"""
+    # `evaluation.EmbeddingSimilarityEvaluator` is the class, so the module has to be looked up by name
+    module = importlib.import_module("sentence_transformers.evaluation.EmbeddingSimilarityEvaluator")
+    monkeypatch.setattr(module, "is_numba_available", lambda: request.param == "numba")
+    monkeypatch.setattr(module, "is_simsimd_available", lambda: request.param == "simsimd")
+    return request.param
+
+
+# The float similarities have no SimSIMD path, only a numba kernel and NumPy reductions
+@pytest.mark.parametrize("similarity_backend", [NUMBA_BACKEND, "numpy"], indirect=True)
+def test_EmbeddingSimilarityEvaluator_float_similarities(similarity_backend: str) -> None:
+    """Tests that the similarities computed from shared paired reductions match the sklearn paired distances"""
+    rng = np.random.default_rng(0)
+    embeddings1 = rng.standard_normal((100, 32), dtype=np.float32)
+    embeddings2 = rng.standard_normal((100, 32), dtype=np.float32)
+    (
+        cosine_scores,
+        manhattan_distances,
+        euclidean_distances,
+        dot_products,
+    ) = evaluation.EmbeddingSimilarityEvaluator.float_similarities(embeddings1, embeddings2)
+    assert np.allclose(cosine_scores, 1 - paired_cosine_distances(embeddings1, embeddings2), atol=1e-6)
+    assert np.allclose(manhattan_distances, -paired_manhattan_distances(embeddings1, embeddings2), atol=1e-5)
+    assert np.allclose(euclidean_distances, -paired_euclidean_distances(embeddings1, embeddings2), atol=1e-5)
+    assert np.allclose(dot_products, [np.dot(emb1, emb2) for emb1, emb2 in zip(embeddings1, embeddings2)], atol=1e-5)
+
+
+def test_EmbeddingSimilarityEvaluator_contiguous_copy_logging(caplog: pytest.LogCaptureFixture) -> None:
+    """Tests that only copies due to the memory layout, rather than to a dtype conversion, are logged"""
+    rng = np.random.default_rng(0)
+    embeddings = rng.standard_normal((100, 64), dtype=np.float32)
+    logger_name = "sentence_transformers.evaluation.EmbeddingSimilarityEvaluator"
+    for embeddings1, embeddings2, expect_log in [
+        (embeddings[:50], embeddings[50:], False),
+        (quantize_embeddings(embeddings[:50], "int8"), quantize_embeddings(embeddings[50:], "int8"), False),
+        (embeddings[:50, ::2], embeddings[50:, ::2], True),
+    ]:
+        caplog.clear()
+        with caplog.at_level("DEBUG", logger=logger_name):
+            evaluation.EmbeddingSimilarityEvaluator.float_similarities(embeddings1, embeddings2)
+        assert any("C-contiguous" in record.message for record in caplog.records) == expect_log
+
+
+def test_EmbeddingSimilarityEvaluator_tensor_similarities() -> None:
+    """Tests that the similarities computed on tensors match those computed on numpy arrays"""
+    rng = np.random.default_rng(0)
+    embeddings1 = rng.standard_normal((100, 32), dtype=np.float32)
+    embeddings2 = rng.standard_normal((100, 32), dtype=np.float32)
+    tensor_similarities = evaluation.EmbeddingSimilarityEvaluator.tensor_similarities(
+        torch.from_numpy(embeddings1), torch.from_numpy(embeddings2)
+    )
+    float_similarities = evaluation.EmbeddingSimilarityEvaluator.float_similarities(embeddings1, embeddings2)
+    for tensor_scores, float_scores in zip(tensor_similarities, float_similarities):
+        assert isinstance(tensor_scores, np.ndarray)
+        assert np.allclose(tensor_scores, float_scores, atol=1e-5)
+
+
+def test_EmbeddingSimilarityEvaluator_tensor_similarities_float16() -> None:
+    """Tests that the distances of float16 tensors are computed without overflowing half precision"""
+    rng = np.random.default_rng(0)
+    embeddings1 = rng.normal(scale=20, size=(100, 768)).astype(np.float16)
+    embeddings2 = rng.normal(scale=20, size=(100, 768)).astype(np.float16)
+    tensor_similarities = evaluation.EmbeddingSimilarityEvaluator.tensor_similarities(
+        torch.from_numpy(embeddings1), torch.from_numpy(embeddings2)
+    )
+    float_similarities = evaluation.EmbeddingSimilarityEvaluator.float_similarities(embeddings1, embeddings2)
+    for tensor_scores, float_scores in zip(tensor_similarities, float_similarities):
+        assert np.isfinite(tensor_scores).all()
+        assert np.allclose(tensor_scores, float_scores, rtol=1e-4)
+
+
+@pytest.mark.parametrize("precomputed", [False, True])
+def test_EmbeddingSimilarityEvaluator_cuda_model(monkeypatch: pytest.MonkeyPatch, precomputed: bool) -> None:
+    """Tests that the similarities of models on a GPU are computed on tensors, with the same metrics"""
+    sentences1, sentences2, scores = get_similarity_dataset()
+    model = RecordingModel()
+    expected_metrics = evaluation.EmbeddingSimilarityEvaluator(sentences1, sentences2, scores).compute_metrices(model)
+
+    # Pretend that the model is on a GPU, while keeping every tensor on the CPU
+    model = RecordingModel()
+    model.device = mock.Mock(type="cuda")
+    as_tensor = torch.as_tensor
+    monkeypatch.setattr(torch, "as_tensor", lambda data, device=None: as_tensor(data))
+    monkeypatch.setattr(
+        evaluation.EmbeddingSimilarityEvaluator,
+        "tensor_similarities",
+        mock.Mock(side_effect=evaluation.EmbeddingSimilarityEvaluator.tensor_similarities),
+    )
+    evaluator = evaluation.EmbeddingSimilarityEvaluator(
+        sentences1,
+        sentences2,
+        scores,
+        precomputed_embeddings1=model.embed(sentences1) if precomputed else None,
+    )
+    metrics = evaluator.compute_metrices(model)
+    evaluation.EmbeddingSimilarityEvaluator.tensor_similarities.assert_called_once()
+    assert model.encoded_sentences == [list(dict.fromkeys(sentences2 if precomputed else sentences1 + sentences2))]
+    assert metrics == pytest.approx(expected_metrics)
+
+
+# The binary similarities have no numba kernel, only a SimSIMD Hamming distance and a popcount lookup table
+@pytest.mark.parametrize("similarity_backend", [SIMSIMD_BACKEND, "numpy"], indirect=True)
+@pytest.mark.parametrize("signed", [False, True])
+def test_EmbeddingSimilarityEvaluator_binary_similarities(similarity_backend: str, signed: bool) -> None:
+    """Tests that the similarities computed on packed binary embeddings match those on the unpacked embeddings"""
+    rng = np.random.default_rng(0)
+    embeddings1 = rng.integers(0, 256, (100, 16), dtype=np.uint8)
+    embeddings2 = rng.integers(0, 256, (100, 16), dtype=np.uint8)
+    unpacked1 = np.unpackbits(embeddings1, axis=1).astype(np.float32)
+    unpacked2 = np.unpackbits(embeddings2, axis=1).astype(np.float32)
+
+    packed1, packed2 = embeddings1, embeddings2
+    if signed:
+        packed1 = (packed1.astype(np.int16) - 128).astype(np.int8)
+        packed2 = (packed2.astype(np.int16) - 128).astype(np.int8)
+    (
+        cosine_scores,
+        manhattan_distances,
+        euclidean_distances,
+        dot_products,
+    ) = evaluation.EmbeddingSimilarityEvaluator.binary_similarities(packed1, packed2, signed=signed)
+    assert np.allclose(cosine_scores, 1 - paired_cosine_distances(unpacked1, unpacked2), atol=1e-6)
+    assert np.allclose(manhattan_distances, -paired_manhattan_distances(unpacked1, unpacked2))
+    assert np.allclose(euclidean_distances, -paired_euclidean_distances(unpacked1, unpacked2))
+    assert np.allclose(dot_products, np.einsum("ij,ij->i", unpacked1, unpacked2))
+
+
+@pytest.mark.parametrize("exception", [TypeError, ValueError])
+def test_EmbeddingSimilarityEvaluator_binary_similarities_simsimd_unsupported(
+    monkeypatch: pytest.MonkeyPatch, exception: type
+) -> None:
+    """Tests that the popcount lookup table is used if the installed SimSIMD cannot compute bin8 Hamming distances"""
+    rng = np.random.default_rng(0)
+    embeddings1 = rng.integers(0, 256, (100, 16), dtype=np.uint8)
+    embeddings2 = rng.integers(0, 256, (100, 16), dtype=np.uint8)
+    expected_similarities = evaluation.EmbeddingSimilarityEvaluator.binary_similarities(embeddings1, embeddings2)
+
+    module = importlib.import_module("sentence_transformers.evaluation.EmbeddingSimilarityEvaluator")
+    simsimd = mock.Mock()
+    simsimd.hamming.side_effect = exception("Unsupported metric and datatype combination")
+    monkeypatch.setattr(module, "is_simsimd_available", lambda: True)
+    monkeypatch.setitem(sys.modules, "simsimd", simsimd)
+    similarities = evaluation.EmbeddingSimilarityEvaluator.binary_similarities(embeddings1, embeddings2)
+    simsimd.hamming.assert_called_once()
+    for scores, expected_scores in zip(similarities, expected_similarities):
+        assert np.allclose(scores, expected_scores)
+
+
+@pytest.mark.parametrize("similarity_backend", SIMILARITY_BACKENDS, indirect=True)
+def test_EmbeddingSimilarityEvaluator_similarities_shape_mismatch(similarity_backend: str) -> None:
+    """Tests that embeddings of different widths are rejected before any similarity kernel reads them"""
+    rng = np.random.default_rng(0)
+    embeddings1 = rng.standard_normal((50, 384), dtype=np.float32)
+    embeddings2 = rng.standard_normal((50, 128), dtype=np.float32)
+    with pytest.raises(ValueError, match="same shape"):
+        evaluation.EmbeddingSimilarityEvaluator.float_similarities(embeddings1, embeddings2)
+    with pytest.raises(ValueError, match="same shape"):
+        evaluation.EmbeddingSimilarityEvaluator.tensor_similarities(
+            torch.from_numpy(embeddings1), torch.from_numpy(embeddings2)
+        )
+    with pytest.raises(ValueError, match="same shape"):
+        evaluation.EmbeddingSimilarityEvaluator.binary_similarities(
+            embeddings1.astype(np.uint8), embeddings2.astype(np.uint8)
+        )
+
+
+@pytest.mark.parametrize("precision", ["int8", "uint8"])
+def test_EmbeddingSimilarityEvaluator_shared_calibration(precision: str) -> None:
+    """Tests that int8/uint8 embeddings of both sentence lists are quantized with a single set of ranges"""
+    sentences1, sentences2, scores = get_similarity_dataset()
+    model = RecordingModel()
+    evaluator = evaluation.EmbeddingSimilarityEvaluator(sentences1, sentences2, scores, precision=precision)
+    metrics = evaluator.compute_metrices(model)
+
+    embeddings = model.embed(sentences1 + sentences2, normalize_embeddings=True)
+    embeddings = quantize_embeddings(embeddings, precision=precision)
+    similarities = evaluation.EmbeddingSimilarityEvaluator.float_similarities(
+        embeddings[: len(sentences1)], embeddings[len(sentences1) :]
+    )
+    for short_name, similarity in zip(["cosine", "manhattan", "euclidean", "dot"], similarities):
+        assert metrics[f"spearman_{short_name}"] == pytest.approx(spearmanr(scores, similarity)[0])
+
+
+def test_EmbeddingSimilarityEvaluator_correlations_float64() -> None:
+    """Tests that the correlations of the float32 scores are computed in float64, even for gold scores with an offset"""
+    sentences1, sentences2, scores = get_similarity_dataset()
+    model = RecordingModel()
+    evaluator = evaluation.EmbeddingSimilarityEvaluator(sentences1, sentences2, scores + 1000)
+    metrics = evaluator.compute_metrices(model)
+
+    labels = evaluator.scores.astype(np.float64)
+    similarities = evaluation.EmbeddingSimilarityEvaluator.float_similarities(
+        model.embed(sentences1), model.embed(sentences2)
+    )
+    for short_name, similarity in zip(["cosine", "manhattan", "euclidean", "dot"], similarities):
+        assert metrics[f"pearson_{short_name}"] == pytest.approx(
+            pearsonr(labels, similarity.astype(np.float64))[0], rel=1e-9
+        )
+        assert metrics[f"spearman_{short_name}"] == pytest.approx(spearmanr(labels, similarity)[0], rel=1e-9)
+
+
+@pytest.mark.parametrize("precomputed_side", [1, 2])
+def test_EmbeddingSimilarityEvaluator_precomputed_embeddings_one_side(precomputed_side: int) -> None:
+    """Tests that only the side without precomputed embeddings is encoded, with the same metrics as a full encode"""
+    sentences1, sentences2, scores = get_similarity_dataset()
+    model = RecordingModel()
+    expected_metrics = evaluation.EmbeddingSimilarityEvaluator(sentences1, sentences2, scores).compute_metrices(model)
+
+    model = RecordingModel()
+    precomputed_sentences, encoded_sentences = (
+        (sentences1, sentences2) if precomputed_side == 1 else (sentences2, sentences1)
+    )
+    evaluator = evaluation.EmbeddingSimilarityEvaluator(
+        sentences1,
+        sentences2,
+        scores,
+        deduplicate=False,
+        **{f"precomputed_embeddings{precomputed_side}": model.embed(precomputed_sentences)},
+    )
+    metrics = evaluator.compute_metrices(model)
+    assert model.encoded_sentences == [encoded_sentences]
+    assert metrics == pytest.approx(expected_metrics)
+
+
+def test_EmbeddingSimilarityEvaluator_precomputed_embeddings_both_sides() -> None:
+    """Tests that the model is not used to encode anything if the embeddings of both sides are precomputed"""
+    sentences1, sentences2, scores = get_similarity_dataset()
+    model = RecordingModel()
+    expected_metrics = evaluation.EmbeddingSimilarityEvaluator(sentences1, sentences2, scores).compute_metrices(model)
+
+    model = RecordingModel()
+    evaluator = evaluation.EmbeddingSimilarityEvaluator(
+        sentences1,
+        sentences2,
+        scores,
+        precomputed_embeddings1=model.embed(sentences1),
+        precomputed_embeddings2=model.embed(sentences2),
+    )
+    metrics = evaluator.compute_metrices(model)
+    assert model.encoded_sentences == []
+    assert metrics == pytest.approx(expected_metrics)
+
+
+def test_EmbeddingSimilarityEvaluator_csv(tmp_path: Path) -> None:
+    """Tests that the results CSV is kept open across evaluations, with a single header per file"""
+    sentences1, sentences2, scores = get_similarity_dataset()
+    model = RecordingModel()
+    evaluator = evaluation.EmbeddingSimilarityEvaluator(sentences1, sentences2, scores, name="sts-dev")
+
+    def read_rows(output_path: Path) -> List[List[str]]:
+        with open(output_path / evaluator.csv_file, newline="", encoding="utf-8") as fIn:
+            return list(csv.reader(fIn))
+
+    first_path = tmp_path / "first"
+    first_path.mkdir()
+    evaluator(model, output_path=str(first_path), epoch=0, steps=10)
+    file_handle = evaluator._csv_file_handle
+    evaluator(model, output_path=str(first_path), epoch=0, steps=20)
+    assert evaluator._csv_file_handle is file_handle
+    rows = read_rows(first_path)
+    assert rows[0] == evaluator.csv_headers
+    assert [row[:2] for row in rows[1:]] == [["0", "10"], ["0", "20"]]
+
+    # A new output path closes the previous file and writes a header to the new one
+    second_path = tmp_path / "second"
+    second_path.mkdir()
+    evaluator(model, output_path=str(second_path), epoch=1, steps=10)
+    assert file_handle.closed
+    rows = read_rows(second_path)
+    assert rows[0] == evaluator.csv_headers
+    assert [row[:2] for row in rows[1:]] == [["1", "10"]]
+
+    # After closing, the next evaluation reopens the existing file and only appends a row
+    evaluator.close()
+    assert evaluator._csv_file_handle is None
+    evaluator(model, output_path=str(first_path), epoch=1, steps=20)
+    rows = read_rows(first_path)
+    assert rows[0] == evaluator.csv_headers
+    assert [row[:2] for row in rows[1:]] == [["0", "10"], ["0", "20"], ["1", "20"]]
+    evaluator.close()
+
+
+@pytest.mark.parametrize("remove", [os.remove, lambda csv_path: shutil.rmtree(csv_path.parent)])
+def test_EmbeddingSimilarityEvaluator_csv_removed(tmp_path: Path, remove: Callable) -> None:
+    """Tests that the results CSV is reopened with a header if it or its directory is removed between evaluations"""
+    sentences1, sentences2, scores = get_similarity_dataset()
+    model = RecordingModel()
+    evaluator = evaluation.EmbeddingSimilarityEvaluator(sentences1, sentences2, scores)
+    output_path = tmp_path / "output"
+    output_path.mkdir()
+    csv_path = output_path / evaluator.csv_file
+    evaluator(model, output_path=str(output_path), epoch=0, steps=10)
+    file_handle = evaluator._csv_file_handle
+
+    remove(csv_path)
+    output_path.mkdir(exist_ok=True)
+    evaluator(model, output_path=str(output_path), epoch=0, steps=20)
+    assert file_handle.closed
+    evaluator.close()
+    with open(csv_path, newline="", encoding="utf-8") as fIn:
+        rows = list(csv.reader(fIn))
+    assert rows[0] == evaluator.csv_headers
+    assert [row[:2] for row in rows[1:]] == [["0", "20"]]
+
+
+@pytest.mark.parametrize("copy_fn", [copy.deepcopy, lambda evaluator: pickle.loads(pickle.dumps(evaluator))])
+def test_EmbeddingSimilarityEvaluator_copy_with_open_csv(tmp_path: Path, copy_fn: Callable) -> None:
+    """Tests that an evaluator with an open results CSV can be copied, and that the copy reopens the CSV"""
+    sentences1, sentences2, scores = get_similarity_dataset()
+    model = RecordingModel()
+    evaluator = evaluation.EmbeddingSimilarityEvaluator(sentences1, sentences2, scores)
+    evaluator(model, output_path=str(tmp_path), epoch=0, steps=10)
+
+    evaluator_copy = copy_fn(evaluator)
+    assert evaluator_copy._csv_file_handle is None
+    assert evaluator._csv_file_handle is not None
+    evaluator.close()
+
+    evaluator_copy(model, output_path=str(tmp_path), epoch=0, steps=20)
+    evaluator_copy.close()
+    with open(tmp_path / evaluator.csv_file, newline="", encoding="utf-8") as fIn:
+        rows = list(csv.reader(fIn))
+    assert rows[0] == evaluator.csv_headers
+    assert [row[:2] for row in rows[1:]] == [["0", "10"], ["0", "20"]]
+
+
+def test_EmbeddingSimilarityEvaluator_precomputed_embeddings_shape() -> None:
+    """Tests that precomputed embeddings with a shape that does not match the other side are rejected"""
+    sentences1, sentences2, scores = get_similarity_dataset()
+    model = RecordingModel(dim=16)
+    for kwargs in [
+        {"precomputed_embeddings1": model.embed(sentences1)[0]},
+        {"precomputed_embeddings1": model.embed(sentences1[:-1])},
+        {
+            "precomputed_embeddings1": model.embed(sentences1),
+            "precomputed_embeddings2": model.embed(sentences2)[:, :8],
+        },
+        {"precomputed_embeddings2": model.embed(sentences2), "truncate_dim": 8},
+    ]:
+        with pytest.raises(AssertionError):
+            evaluation.EmbeddingSimilarityEvaluator(sentences1, sentences2, scores, **kwargs)
+
+    # The width of the encoded side is only known once the model has encoded it
+    evaluator = evaluation.EmbeddingSimilarityEvaluator(
+        sentences1, sentences2, scores, precomputed_embeddings1=RecordingModel(dim=8).embed(sentences1)
+    )
+    with pytest.raises(ValueError, match="same shape"):
+        evaluator.compute_metrices(model)
+
+
+def test_EmbeddingSimilarityEvaluator_deduplicate() -> None:
+    """Tests that each unique sentence is encoded only once, without changing the metrics"""
+    sentences1, sentences2, scores = get_similarity_dataset()
+    model = RecordingModel()
+    metrics = evaluation.EmbeddingSimilarityEvaluator(sentences1, sentences2, scores).compute_metrices(model)
+    assert model.encoded_sentences == [list(dict.fromkeys(sentences1 + sentences2))]
+
+    model = RecordingModel()
+    evaluator = evaluation.EmbeddingSimilarityEvaluator(sentences1, sentences2, scores, deduplicate=False)
+    assert evaluator.compute_metrices(model) == pytest.approx(metrics)
+    assert model.encoded_sentences == [sentences1 + sentences2]
+
+
+def test_EmbeddingSimilarityEvaluator_deduplicate_unhashable() -> None:
+    """Tests that unhashable inputs are all encoded, rather than deduplicated"""
+    sentences1, sentences2, scores = get_similarity_dataset()
+    sentences1 = [[sentence] for sentence in sentences1]
+    sentences2 = [[sentence] for sentence in sentences2]
+    model = RecordingModel()
+    evaluation.EmbeddingSimilarityEvaluator(sentences1, sentences2, scores).compute_metrices(model)
+    assert model.encoded_sentences == [sentences1 + sentences2]
+
+
 def test_LabelAccuracyEvaluator(paraphrase_distilroberta_base_v1_model: SentenceTransformer) -> None:
     """Tests that the LabelAccuracyEvaluator can be loaded correctly"""
     model = paraphrase_distilroberta_base_v1_model
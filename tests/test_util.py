@@ -1,4 +1,9 @@
+import importlib
+import sys
+from unittest import mock
+
 import numpy as np
+import pytest
 import sklearn
 import torch
 
@@ -143,3 +148,27 @@ def test_dot_score_cos_sim() -> None:
 
     assert np.allclose(cosine_calculated, dot_and_cosine_expected)
     assert np.allclose(dot_calculated, dot_and_cosine_expected)
+
+
+def test_is_numba_available_import_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Tests that an installed numba that fails to import, e.g. due to an unsupported NumPy version, is unavailable"""
+    monkeypatch.setattr(importlib.util, "find_spec", mock.Mock(return_value=mock.Mock()))
+    # A None entry in sys.modules makes `import numba` raise an ImportError
+    monkeypatch.setitem(sys.modules, "numba", None)
+    util.is_numba_available.cache_clear()
+    try:
+        assert not util.is_numba_available()
+    finally:
+        util.is_numba_available.cache_clear()
+
+
+def test_is_simsimd_available_import_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Tests that an installed simsimd that fails to import, e.g. due to a NumPy ABI mismatch, is unavailable"""
+    monkeypatch.setattr(importlib.util, "find_spec", mock.Mock(return_value=mock.Mock()))
+    # A None entry in sys.modules makes `import simsimd` raise an ImportError
+    monkeypatch.setitem(sys.modules, "simsimd", None)
+    util.is_simsimd_available.cache_clear()
+    try:
+        assert not util.is_simsimd_available()
+    finally:
+        util.is_simsimd_available.cache_clear()